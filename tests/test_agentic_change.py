@@ -30,6 +30,7 @@ Note: Z3 formal verification is not applied here. The logic under test is primar
 
 import json
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 from pathlib import Path
 
@@ -143,39 +144,33 @@ def test_happy_path_clone_repo(mock_dependencies):
     comments_data = [
         {"user": {"login": "commenter"}, "body": "I agree"}
     ]
-    
+
+    # Serialize once; the side effect below runs per subprocess call.
+    issue_json = json.dumps(issue_data)
+    comments_json = json.dumps(comments_data)
+
     # 3. Git remote check (simulating we are NOT in the repo)
     # We need to mock Path.cwd() to return a path where .git does not exist
     # or ensure the subprocess check fails/returns mismatch.
     # The code checks `(Path.cwd() / ".git").exists()`.
-    
+
     def subprocess_side_effect(args, **kwargs):
         cmd = args if isinstance(args, list) else []
 
         # Comments API (check BEFORE Issue API since comments URL contains "issues/1" too)
         if "api" in cmd and "comments" in cmd[-1]:
-            m = MagicMock()
-            m.returncode = 0
-            m.stdout = json.dumps(comments_data)
-            return m
+            return SimpleNamespace(returncode=0, stdout=comments_json, stderr="")
 
         # Issue API
         if "api" in cmd and "issues/1" in cmd[-1]:
-            m = MagicMock()
-            m.returncode = 0
-            m.stdout = json.dumps(issue_data)
-            return m
+            return SimpleNamespace(returncode=0, stdout=issue_json, stderr="")
 
         # Clone command
         if "repo" in cmd and "clone" in cmd:
-            m = MagicMock()
-            m.returncode = 0
-            return m
+            return SimpleNamespace(returncode=0, stdout="", stderr="")
 
-        # Default fallback
-        m = MagicMock()
-        m.returncode = 1  # Fail other commands (like git remote) to force clone path
-        return m
+        # Default fallback: fail other commands (like git remote) to force clone path
+        return SimpleNamespace(returncode=1, stdout="", stderr="")
 
     mock_subprocess.side_effect = subprocess_side_effect
 
@@ -219,27 +214,21 @@ def test_happy_path_current_directory(mock_dependencies):
     _, mock_subprocess, mock_orch, _ = mock_dependencies
     
     issue_data = {"title": "T", "body": "B", "user": {"login": "u"}, "comments_url": ""}
-    
+    issue_json = json.dumps(issue_data)
+
     def subprocess_side_effect(args, **kwargs):
         cmd = args if isinstance(args, list) else []
         
         if "api" in cmd:
-            m = MagicMock()
-            m.returncode = 0
-            m.stdout = json.dumps(issue_data)
-            return m
-            
-        # Git remote check
+            return SimpleNamespace(returncode=0, stdout=issue_json, stderr="")
+
+        # Git remote check: return a matching remote URL
         if "git" in cmd and "remote" in cmd:
-            m = MagicMock()
-            m.returncode = 0
-            # Return a matching remote URL
-            m.stdout = "https://github.com/owner/repo.git" 
-            return m
-            
-        m = MagicMock()
-        m.returncode = 0
-        return m
+            return SimpleNamespace(
+                returncode=0, stdout="https://github.com/owner/repo.git", stderr=""
+            )
+
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
 
     mock_subprocess.side_effect = subprocess_side_effect
 
@@ -271,28 +260,21 @@ def test_comments_fetch_failure_resilience(mock_dependencies):
     _, mock_subprocess, mock_orch, _ = mock_dependencies
     
     issue_data = {"title": "T", "body": "BodyOnly", "user": {"login": "u"}, "comments_url": "http://bad.url"}
-    
+    issue_json = json.dumps(issue_data)
+
     def subprocess_side_effect(args, **kwargs):
         cmd = args if isinstance(args, list) else []
         
         # Issue API succeeds
         if "api" in cmd and "issues/1" in cmd[-1]:
-            m = MagicMock()
-            m.returncode = 0
-            m.stdout = json.dumps(issue_data)
-            return m
-            
+            return SimpleNamespace(returncode=0, stdout=issue_json, stderr="")
+
         # Comments API fails
         if "api" in cmd and "bad.url" in cmd[-1]:
-            m = MagicMock()
-            m.returncode = 1
-            m.stderr = "Error"
-            return m
-            
+            return SimpleNamespace(returncode=1, stdout="", stderr="Error")
+
         # Clone succeeds
-        m = MagicMock()
-        m.returncode = 0
-        return m
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
 
     mock_subprocess.side_effect = subprocess_side_effect
     
@@ -314,26 +296,19 @@ def test_clone_failure(mock_dependencies):
     _, mock_subprocess, _, _ = mock_dependencies
     
     issue_data = {"title": "T", "body": "B", "user": {"login": "u"}, "comments_url": ""}
-    
+    issue_json = json.dumps(issue_data)
+
     def subprocess_side_effect(args, **kwargs):
         cmd = args if isinstance(args, list) else []
         
         if "api" in cmd:
-            m = MagicMock()
-            m.returncode = 0
-            m.stdout = json.dumps(issue_data)
-            return m
-            
+            return SimpleNamespace(returncode=0, stdout=issue_json, stderr="")
+
         # Clone fails
         if "repo" in cmd and "clone" in cmd:
-            m = MagicMock()
-            m.returncode = 1
-            m.stderr = "Permission denied"
-            return m
-            
-        m = MagicMock()
-        m.returncode = 1 # Force clone path
-        return m
+            return SimpleNamespace(returncode=1, stdout="", stderr="Permission denied")
+
+        return SimpleNamespace(returncode=1, stdout="", stderr="")  # Force clone path
 
     mock_subprocess.side_effect = subprocess_side_effect
     
@@ -30,6 +30,12 @@ from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 
 
+import pdd
+
+# Resolved once; the autouse fixture below only needs to re-set the env var
+# per test, not re-derive the package directory.
+_PDD_DIR = str(Path(pdd.__file__).parent)
+
 @pytest.fixture(autouse=True)
 def set_pdd_path(monkeypatch):
     """Set PDD_PATH to the pdd package directory for all tests in this module.
@@ -37,9 +43,7 @@ def set_pdd_path(monkeypatch):
     This is required because construct_paths uses PDD_PATH to find the language_format.csv
     file for language detection.
     """
-    import pdd
-    pdd_package_dir = Path(pdd.__file__).parent
-    monkeypatch.setenv("PDD_PATH", str(pdd_package_dir))
+    monkeypatch.setenv("PDD_PATH", _PDD_DIR)
 
 
 class TestDuplicateIncludesE2E:
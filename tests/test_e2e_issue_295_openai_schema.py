@@ -21,12 +21,19 @@ The test should FAIL on buggy code (missing additionalProperties: false) and
 PASS once the fix is applied.
 """
 
+import pandas as pd
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from click.testing import CliRunner
 
 
+import pdd
+
+# Resolved once; the autouse fixture below only needs to re-set the env var
+# per test, not re-derive the package directory.
+_PDD_DIR = str(Path(pdd.__file__).parent)
+
 @pytest.fixture(autouse=True)
 def set_pdd_path(monkeypatch):
     """Set PDD_PATH to the pdd package directory for all tests in this module.
@@ -34,9 +41,7 @@ def set_pdd_path(monkeypatch):
     This is required because construct_paths uses PDD_PATH to find the language_format.csv
     file for language detection.
     """
-    import pdd
-    pdd_package_dir = Path(pdd.__file__).parent
-    monkeypatch.setenv("PDD_PATH", str(pdd_package_dir))
+    monkeypatch.setenv("PDD_PATH", _PDD_DIR)
 
 
 class TestOpenAIStrictModeSchemaE2E:
@@ -160,7 +165,6 @@ print("Hello, World!")
             return mock_response
 
         # 3. Mock the model data to use only OpenAI models
-        import pandas as pd
         from collections import namedtuple
 
         MockModelInfoData = namedtuple("MockModelInfoData", [
@@ -234,7 +238,6 @@ print("Hello, World!")
         """
         from pydantic import BaseModel
         from pdd.llm_invoke import llm_invoke
-        import pandas as pd
         from collections import namedtuple
 
         # Force local execution
@@ -24,6 +24,7 @@ This E2E test:
 The test should FAIL on buggy code (warning is logged) and PASS once the fix is applied.
 """
 
+import pandas as pd
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -32,6 +33,12 @@ import logging
 import os
 
 
+import pdd
+
+# Resolved once; the autouse fixture below only needs to re-set the env var
+# per test, not re-derive the package directory.
+_PDD_DIR = str(Path(pdd.__file__).parent)
+
 @pytest.fixture(autouse=True)
 def set_pdd_path(monkeypatch):
     """Set PDD_PATH to the pdd package directory for all tests in this module.
@@ -39,9 +46,7 @@ def set_pdd_path(monkeypatch):
     This is required because construct_paths uses PDD_PATH to find the language_format.csv
     file for language detection.
     """
-    import pdd
-    pdd_package_dir = Path(pdd.__file__).parent
-    monkeypatch.setenv("PDD_PATH", str(pdd_package_dir))
+    monkeypatch.setenv("PDD_PATH", _PDD_DIR)
 
 
 @pytest.mark.e2e
@@ -108,7 +113,6 @@ def add(a, b):
             return mock_response
 
         # 4. Patch _load_model_data to use our custom CSV
-        import pandas as pd
 
         def load_custom_csv(path=None):
             """Load model data from custom CSV - ignores path parameter."""
@@ -212,7 +216,6 @@ OpenAI,gpt-4o-mini,0.15,0.6,1450,TRUE,,OPENAI_API_KEY,,,none,0
             mock_response.usage.total_tokens = 30
             return mock_response
 
-        import pandas as pd
 
         def load_no_gpt5_csv(path=None):
             """Load model data without gpt-5* models - ignores path parameter."""
@@ -15,18 +15,23 @@ listed in 'required', causing this error:
 This test should FAIL on buggy code and PASS once the fix is applied.
 """
 
+import pandas as pd
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from pydantic import BaseModel, Field
 
 
+import pdd
+
+# Resolved once; the autouse fixture below only needs to re-set the env var
+# per test, not re-derive the package directory.
+_PDD_DIR = str(Path(pdd.__file__).parent)
+
 @pytest.fixture(autouse=True)
 def set_pdd_path(monkeypatch):
     """Set PDD_PATH to the pdd package directory."""
-    import pdd
-    pdd_package_dir = Path(pdd.__file__).parent
-    monkeypatch.setenv("PDD_PATH", str(pdd_package_dir))
+    monkeypatch.setenv("PDD_PATH", _PDD_DIR)
 
 
 class TestOpenAIRequiredArraySchema:
@@ -72,7 +77,6 @@ class TestOpenAIRequiredArraySchema:
         before sending to OpenAI.
         """
         from pdd.llm_invoke import llm_invoke
-        import pandas as pd
         from collections import namedtuple
 
         # Force local execution